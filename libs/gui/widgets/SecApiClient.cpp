@@ -9,180 +9,221 @@
 SecApiClient::SecApiClient(QObject* parent)
     : QObject(parent)
     , m_pythonProcess(nullptr)
+    , m_nextRequestId(0)
     , m_pythonReady(false)
+    , m_restartAttempts(0)
     , m_initTimer(new QTimer(this))
 {
+    m_initTimer->setSingleShot(true);
+    connect(m_initTimer, &QTimer::timeout, this, &SecApiClient::initializePython);
     initializePython();
 }
 
 SecApiClient::~SecApiClient() {
-    if (m_pythonProcess) {
-        m_pythonProcess->kill();
-        m_pythonProcess->waitForFinished(3000);
+    if (m_pythonProcess && m_pythonProcess->state() != QProcess::NotRunning) {
+        m_pythonProcess->disconnect(this);
+        // Closing stdin lets the worker finish in-flight requests and exit cleanly
+        m_pythonProcess->closeWriteChannel();
+        if (!m_pythonProcess->waitForFinished(3000)) {
+            m_pythonProcess->kill();
+            m_pythonProcess->waitForFinished(1000);
+        }
     }
 }
 
 void SecApiClient::initializePython() {
     emit statusUpdate("Initializing SEC API...");
     
-    // Test if we can import the SEC module
-    QString testCommand = QString(
-        "import sys; "
-        "sys.path.insert(0, r'%1'); "
-        "from sec.sec_api import SECDataFetcher; "
-        "print('SEC_API_READY')"
-    ).arg(getSecModulePath());
+    if (m_pythonProcess) {
+        // Restarting: the previous worker has already exited
+        m_pythonProcess->disconnect(this);
+        m_pythonProcess->deleteLater();
+    }
+    
+    m_pythonProcess = new QProcess(this);
+    // Forward worker logging to our stderr instead of buffering it for the worker's lifetime
+    m_pythonProcess->setProcessChannelMode(QProcess::ForwardedErrorChannel);
+    connect(m_pythonProcess, &QProcess::readyReadStandardOutput, this, &SecApiClient::onWorkerReadyRead);
+    connect(m_pythonProcess, QOverload<int, QProcess::ExitStatus>::of(&QProcess::finished),
+            this, &SecApiClient::onWorkerFinished);
+    connect(m_pythonProcess, &QProcess::errorOccurred, this, &SecApiClient::onWorkerError);
+    
+    QString pythonExe = getPythonExecutable();
+    QString workerPath = QDir(getScriptsPath()).absoluteFilePath("sec_worker.py");
+    
+    qDebug() << "Starting SEC worker:" << pythonExe << workerPath;
     
-    m_currentOperation = "init";
-    executePythonCommand(testCommand, "init");
+    // The worker reports {"event": "ready"} once SECDataFetcher is imported
+    m_pythonProcess->start(pythonExe, QStringList() << workerPath);
+}
+
+void SecApiClient::scheduleRestart() {
+    if (m_initTimer->isActive()) {
+        return;
+    }
+    
+    if (m_restartAttempts >= kMaxRestartAttempts) {
+        emit statusUpdate("SEC worker stopped; it will be restarted on the next request");
+        return;
+    }
+    
+    // Back off 1s, 2s, 4s so a worker that dies on startup doesn't spin
+    int delayMs = kRestartBaseDelayMs << m_restartAttempts;
+    ++m_restartAttempts;
+    emit statusUpdate(QString("Restarting SEC worker in %1s...").arg(delayMs / 1000));
+    m_initTimer->start(delayMs);
+}
+
+bool SecApiClient::ensureWorker() {
+    if (m_pythonReady) {
+        return true;
+    }
+    
+    // Out of automatic restarts: start the worker again lazily on demand
+    if (m_pythonProcess->state() == QProcess::NotRunning && !m_initTimer->isActive()) {
+        m_restartAttempts = 0;
+        initializePython();
+    }
+    return false;
 }
 
 void SecApiClient::fetchFilings(const QString& ticker, const QString& formType) {
-    if (!m_pythonReady) {
+    if (!ensureWorker()) {
         emit apiError("SEC API not ready");
         return;
     }
     
     emit statusUpdate(QString("Fetching %1 filings for %2...").arg(formType.isEmpty() ? "all" : formType, ticker));
 
-    QStringList args;
-    args << ticker;
+    QJsonObject request;
+    request["ticker"] = ticker;
     if (!formType.isEmpty()) {
-        args << formType;
+        request["form_type"] = formType;
     }
 
-    runSecScript("sec_fetch_filings.py", args, "filings");
+    sendRequest("filings", request);
 }
 
 void SecApiClient::fetchInsiderTransactions(const QString& ticker) {
-    if (!m_pythonReady) {
+    if (!ensureWorker()) {
         emit apiError("SEC API not ready");
         return;
     }
     
     emit statusUpdate(QString("Fetching insider transactions for %1...").arg(ticker));
 
-    QStringList args;
-    args << ticker;
+    QJsonObject request;
+    request["ticker"] = ticker;
 
-    runSecScript("sec_fetch_transactions.py", args, "transactions");
+    sendRequest("transactions", request);
 }
 
 void SecApiClient::fetchFinancialSummary(const QString& ticker) {
-    if (!m_pythonReady) {
+    if (!ensureWorker()) {
         emit apiError("SEC API not ready");
         return;
     }
     
     emit statusUpdate(QString("Fetching financial summary for %1...").arg(ticker));
 
-    QStringList args;
-    args << ticker;
+    QJsonObject request;
+    request["ticker"] = ticker;
 
-    runSecScript("sec_fetch_financials.py", args, "financials");
+    sendRequest("financials", request);
 }
 
-void SecApiClient::executePythonCommand(const QString& command, const QString& operation) {
-    if (m_pythonProcess && m_pythonProcess->state() != QProcess::NotRunning) {
-        m_pythonProcess->kill();
-        m_pythonProcess->waitForFinished(1000);
-    }
-    
-    if (m_pythonProcess) {
-        m_pythonProcess->deleteLater();
-    }
-    
-    m_pythonProcess = new QProcess(this);
-    connect(m_pythonProcess, QOverload<int, QProcess::ExitStatus>::of(&QProcess::finished),
-            this, &SecApiClient::onPythonFinished);
-    connect(m_pythonProcess, &QProcess::errorOccurred, this, &SecApiClient::onPythonError);
-    
-    QStringList args;
-    args << "-c" << command;
-    
-    QString pythonExe = getPythonExecutable();
-    qDebug() << "Executing Python inline command:" << pythonExe << args;
-    
-    m_pythonProcess->start(pythonExe, args);
-}
+void SecApiClient::sendRequest(const QString& op, QJsonObject request) {
+    request["id"] = ++m_nextRequestId;
+    request["op"] = op;
+    m_latestRequestIds[op] = m_nextRequestId;
 
-void SecApiClient::runSecScript(const QString& scriptName,
-                                const QStringList& args,
-                                const QString& operation) {
-    if (m_pythonProcess && m_pythonProcess->state() != QProcess::NotRunning) {
-        m_pythonProcess->kill();
-        m_pythonProcess->waitForFinished(1000);
-    }
+    QByteArray line = QJsonDocument(request).toJson(QJsonDocument::Compact);
+    line.append('\n');
 
-    if (m_pythonProcess) {
-        m_pythonProcess->deleteLater();
-    }
+    qDebug() << "SEC worker request:" << line.trimmed();
 
-    m_pythonProcess = new QProcess(this);
-    connect(m_pythonProcess, QOverload<int, QProcess::ExitStatus>::of(&QProcess::finished),
-            this, &SecApiClient::onPythonFinished);
-    connect(m_pythonProcess, &QProcess::errorOccurred, this, &SecApiClient::onPythonError);
-
-    QString pythonExe = getPythonExecutable();
-    QString scriptsPath = getScriptsPath();
-    QString scriptPath = QDir(scriptsPath).absoluteFilePath(scriptName);
-
-    QStringList fullArgs;
-    fullArgs << scriptPath;
-    fullArgs << args;
-
-    m_currentOperation = operation;
-
-    qDebug() << "Executing SEC script:" << pythonExe << fullArgs;
+    m_pythonProcess->write(line);
+}
 
-    m_pythonProcess->start(pythonExe, fullArgs);
+void SecApiClient::onWorkerReadyRead() {
+    // One JSON message per line; partial lines stay buffered until complete
+    while (m_pythonProcess->canReadLine()) {
+        QByteArray line = m_pythonProcess->readLine().trimmed();
+        if (!line.isEmpty()) {
+            handleWorkerMessage(line);
+        }
+    }
 }
 
-void SecApiClient::onPythonFinished(int exitCode, QProcess::ExitStatus exitStatus) {
-    if (exitStatus != QProcess::NormalExit || exitCode != 0) {
-        QString error = QString("Python process failed (exit code %1): %2")
-                       .arg(exitCode)
-                       .arg(m_pythonProcess->readAllStandardError());
-        emit apiError(error);
+void SecApiClient::handleWorkerMessage(const QByteArray& line) {
+    QJsonParseError error;
+    QJsonDocument doc = QJsonDocument::fromJson(line, &error);
+    
+    if (error.error != QJsonParseError::NoError || !doc.isObject()) {
+        qDebug() << "SEC worker output:" << line;
         return;
     }
     
-    QString output = m_pythonProcess->readAllStandardOutput();
-    qDebug() << "Python output:" << output;
+    QJsonObject message = doc.object();
     
-    if (m_currentOperation == "init") {
-        if (output.contains("SEC_API_READY")) {
-            m_pythonReady = true;
-            emit statusUpdate("SEC API ready");
-        } else {
-            emit apiError("Failed to initialize SEC API: " + output);
-        }
+    if (message["event"].toString() == "ready") {
+        m_pythonReady = true;
+        m_restartAttempts = 0;
+        emit statusUpdate("SEC API ready");
         return;
     }
     
-    // Parse data outputs
-    if (output.contains("FILINGS_DATA:")) {
-        QString jsonStr = output.mid(output.indexOf("FILINGS_DATA:") + 13).trimmed();
-        parseFilingsData(jsonStr);
+    QString op = message["op"].toString();
+    
+    // The worker answers concurrently, so an older request can finish after a newer
+    // one for the same op (e.g. switching tickers); only the latest result is shown
+    if (!op.isEmpty() && message["id"].toInt() != m_latestRequestIds.value(op)) {
+        qDebug() << "Dropping stale SEC" << op << "response" << message["id"].toInt();
+        return;
     }
-    else if (output.contains("TRANSACTIONS_DATA:")) {
-        QString jsonStr = output.mid(output.indexOf("TRANSACTIONS_DATA:") + 18).trimmed();
-        parseTransactionsData(jsonStr);
+    
+    if (message.contains("error")) {
+        emit apiError(QString("SEC %1 request failed: %2").arg(op, message["error"].toString()));
+        return;
     }
-    else if (output.contains("FINANCIALS_DATA:")) {
-        QString jsonStr = output.mid(output.indexOf("FINANCIALS_DATA:") + 16).trimmed();
-        parseFinancialsData(jsonStr);
+    
+    if (op == "filings") {
+        parseFilingsData(message["data"].toArray());
+    }
+    else if (op == "transactions") {
+        parseTransactionsData(message["data"].toArray());
+    }
+    else if (op == "financials") {
+        parseFinancialsData(message["data"].toObject());
     }
     else {
-        emit apiError("Unexpected output: " + output);
+        emit apiError("Unexpected output: " + QString::fromUtf8(line));
     }
 }
 
-void SecApiClient::onPythonError(QProcess::ProcessError error) {
+void SecApiClient::onWorkerFinished(int exitCode, QProcess::ExitStatus exitStatus) {
+    m_pythonReady = false;
+    // In-flight requests died with the worker
+    m_latestRequestIds.clear();
+    
+    QString error = QString("SEC worker exited (exit code %1%2)")
+                   .arg(exitCode)
+                   .arg(exitStatus == QProcess::CrashExit ? ", crashed" : "");
+    emit apiError(error);
+    scheduleRestart();
+}
+
+void SecApiClient::onWorkerError(QProcess::ProcessError error) {
     QString errorString = QString("Python process error (%1): %2")
                          .arg(error)
                          .arg(m_pythonProcess->errorString());
     emit apiError(errorString);
+    
+    // finished() is never emitted when the process couldn't be started at all
+    if (error == QProcess::FailedToStart) {
+        m_pythonReady = false;
+        scheduleRestart();
+    }
 }
 
 QString SecApiClient::getPythonExecutable() const {
@@ -202,17 +243,6 @@ QString SecApiClient::getPythonExecutable() const {
     #endif
 }
 
-QString SecApiClient::getSecModulePath() const {
-    // Prefer project root inferred from the scripts directory so that
-    // sec/ can be imported reliably regardless of working directory.
-    QDir scriptsDir(getScriptsPath());
-    if (scriptsDir.cdUp()) {
-        return scriptsDir.absolutePath();
-    }
-
-    return QDir::current().absolutePath();
-}
-
 QString SecApiClient::getScriptsPath() const {
     // 1) Try alongside the application binary: <appDir>/scripts
     QString appDir = QCoreApplication::applicationDirPath();
@@ -237,17 +267,8 @@ QString SecApiClient::getScriptsPath() const {
     return QDir::current().absoluteFilePath("scripts");
 }
 
-void SecApiClient::parseFilingsData(const QString& jsonStr) {
-    QJsonParseError error;
-    QJsonDocument doc = QJsonDocument::fromJson(jsonStr.toUtf8(), &error);
-    
-    if (error.error != QJsonParseError::NoError) {
-        emit apiError("Failed to parse filings data: " + error.errorString());
-        return;
-    }
-    
+void SecApiClient::parseFilingsData(const QJsonArray& array) {
     QList<Filing> filings;
-    QJsonArray array = doc.array();
     
     for (const QJsonValue& value : array) {
         QJsonObject obj = value.toObject();
@@ -263,17 +284,8 @@ void SecApiClient::parseFilingsData(const QString& jsonStr) {
     emit statusUpdate(QString("Loaded %1 filings").arg(filings.size()));
 }
 
-void SecApiClient::parseTransactionsData(const QString& jsonStr) {
-    QJsonParseError error;
-    QJsonDocument doc = QJsonDocument::fromJson(jsonStr.toUtf8(), &error);
-    
-    if (error.error != QJsonParseError::NoError) {
-        emit apiError("Failed to parse transactions data: " + error.errorString());
-        return;
-    }
-    
+void SecApiClient::parseTransactionsData(const QJsonArray& array) {
     QList<Transaction> transactions;
-    QJsonArray array = doc.array();
     
     for (const QJsonValue& value : array) {
         QJsonObject obj = value.toObject();
@@ -290,17 +302,8 @@ void SecApiClient::parseTransactionsData(const QString& jsonStr) {
     emit statusUpdate(QString("Loaded %1 transactions").arg(transactions.size()));
 }
 
-void SecApiClient::parseFinancialsData(const QString& jsonStr) {
-    QJsonParseError error;
-    QJsonDocument doc = QJsonDocument::fromJson(jsonStr.toUtf8(), &error);
-    
-    if (error.error != QJsonParseError::NoError) {
-        emit apiError("Failed to parse financials data: " + error.errorString());
-        return;
-    }
-    
+void SecApiClient::parseFinancialsData(const QJsonObject& obj) {
     QList<FinancialMetric> metrics;
-    QJsonObject obj = doc.object();
     
     for (auto it = obj.begin(); it != obj.end(); ++it) {
         FinancialMetric metric;
@@ -8,10 +8,13 @@
 #include <QJsonDocument>
 #include <QProcess>
 #include <QTimer>
+#include <QHash>
 
 /**
- * Direct Python SEC API client that runs helper scripts via subprocess.
- * Replaces the microservice approach with direct subprocess calls to scripts/sec_fetch_*.py.
+ * Python SEC API client backed by a persistent worker process.
+ * Starts scripts/sec_worker.py once and multiplexes NDJSON requests over its
+ * stdin/stdout, so fetches reuse one interpreter and SECDataFetcher instead of
+ * spawning a scripts/sec_fetch_*.py process per request.
  */
 class SecApiClient : public QObject {
     Q_OBJECT
@@ -56,22 +59,29 @@ signals:
     void statusUpdate(const QString& message);
 
 private slots:
-    void onPythonFinished(int exitCode, QProcess::ExitStatus exitStatus);
-    void onPythonError(QProcess::ProcessError error);
+    void onWorkerReadyRead();
+    void onWorkerFinished(int exitCode, QProcess::ExitStatus exitStatus);
+    void onWorkerError(QProcess::ProcessError error);
 
 private:
     void initializePython();
-    void executePythonCommand(const QString& command, const QString& operation);
-    void runSecScript(const QString& scriptName, const QStringList& args, const QString& operation);
+    void scheduleRestart();
+    bool ensureWorker();
+    void sendRequest(const QString& op, QJsonObject request);
+    void handleWorkerMessage(const QByteArray& line);
     QString getPythonExecutable() const;
-    QString getSecModulePath() const;
     QString getScriptsPath() const;
-    void parseFilingsData(const QString& jsonStr);
-    void parseTransactionsData(const QString& jsonStr);
-    void parseFinancialsData(const QString& jsonStr);
+    void parseFilingsData(const QJsonArray& array);
+    void parseTransactionsData(const QJsonArray& array);
+    void parseFinancialsData(const QJsonObject& obj);
 
     QProcess* m_pythonProcess;
-    QString m_currentOperation;
+    int m_nextRequestId;
+    QHash<QString, int> m_latestRequestIds;  // op -> id of the newest request, older responses are stale
     bool m_pythonReady;
-    QTimer* m_initTimer;
+    int m_restartAttempts;
+    QTimer* m_initTimer;  // single-shot backoff before restarting a worker that exited
+
+    static constexpr int kMaxRestartAttempts = 3;
+    static constexpr int kRestartBaseDelayMs = 1000;
 };
\ No newline at end of file
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time compile the order book generator kernels with Numba
+
+Builds scripts/_ext/orderbook_kernels.<platform>.so (.pyd on Windows), which
+orderbook_kernels.py imports in preference to JIT-compiling the kernels.
+Rebuild after changing the kernels or upgrading Python/NumPy; delete the
+compiled module to go back to JIT compilation.
+
+Usage:
+    python3 scripts/build_aot.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from orderbook_kernels import mid_price_walk
+
+def main():
+    """Main function"""
+    output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_ext")
+    os.makedirs(output_dir, exist_ok=True)
+    
+    cc = CC('orderbook_kernels')
+    cc.output_dir = output_dir
+    cc.export('simulate_mid_prices', 'void(f8[:, :], f8, f8[:])')(mid_price_walk)
+    
+    print(f"🔨 Compiling orderbook_kernels into {output_dir}...")
+    cc.compile()
+    print("✅ Done! The order book generators will now use the compiled kernels.")
+
+if __name__ == "__main__":
+    main()
@@ -6,86 +6,26 @@ Creates 5 minutes of realistic BTC order book data at 100ms intervals.
 This is much smaller and faster to process for fractal zoom testing.
 
 Usage:
-    python3 scripts/generate_small_test_orderbook.py
+    python3 scripts/generate_small_test_orderbook.py [--format {json,npz,parquet}]
     
 Output:
-    logs/small_test_orderbook_data.json - 5 minutes of order book snapshots
+    logs/small_test_orderbook_data.json - 5 minutes of order book snapshots (default)
+    logs/small_test_orderbook_data.npz / .parquet - same data in the other formats
 """
 
-import json
-import random
+import argparse
+import os
 import time
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Optional
 
-class OrderBookGenerator:
-    def __init__(self, base_price: float = 108000.0, base_spread: float = 0.01):
-        self.base_price = base_price
-        self.base_spread = base_spread
-        self.current_price = base_price
-        self.price_trend = 0.0
-        
-    def generate_price_movement(self) -> float:
-        """Generate realistic price movement with trend and volatility"""
-        volatility = 0.0001
-        trend_change = random.gauss(0, 0.0001)
-        self.price_trend = self.price_trend * 0.99 + trend_change
-        
-        random_component = random.gauss(0, volatility)
-        price_change = self.price_trend + random_component
-        
-        self.current_price *= (1 + price_change)
-        self.current_price = max(100000, min(120000, self.current_price))
-        
-        return self.current_price
-    
-    def generate_order_levels(self, mid_price: float, side: str, num_levels: int = 20) -> List[Dict]:
-        """Generate realistic order book levels (reduced from 50 to 20 for speed)"""
-        levels = []
-        
-        spread_multiplier = 1.0 if side == 'bid' else -1.0
-        base_offset = self.base_spread * spread_multiplier
-        
-        for i in range(num_levels):
-            level_offset = base_offset * (1 + i * 0.1)
-            price = mid_price + (mid_price * level_offset)
-            
-            base_volume = 10.0 * (1 / (1 + i * 0.2))
-            volume_noise = random.uniform(0.5, 2.0)
-            volume = base_volume * volume_noise
-            
-            if random.random() < 0.05:
-                volume *= random.uniform(5, 20)
-            
-            levels.append({
-                'price': round(price, 2),
-                'size': round(volume, 6)
-            })
-        
-        if side == 'bid':
-            levels.sort(key=lambda x: x['price'], reverse=True)
-        else:
-            levels.sort(key=lambda x: x['price'])
-            
-        return levels
-    
-    def generate_snapshot(self, timestamp_ms: int) -> Dict:
-        """Generate a single order book snapshot"""
-        current_price = self.generate_price_movement()
-        
-        bids = self.generate_order_levels(current_price, 'bid', 20)
-        asks = self.generate_order_levels(current_price, 'ask', 20)
-        
-        return {
-            'timestamp': timestamp_ms,
-            'symbol': 'BTC-USD',
-            'bids': bids,
-            'asks': asks,
-            'mid_price': current_price,
-            'spread': asks[0]['price'] - bids[0]['price'] if bids and asks else 0.0
-        }
+import numpy as np
+
+from orderbook_data import (
+    OUTPUT_FORMATS, OrderBookGenerator, allocate_order_book, iter_snapshots, pa, save_order_book
+)
 
-def generate_small_test_data(duration_minutes: int = 5, interval_ms: int = 100) -> List[Dict]:
+def generate_small_test_data(duration_minutes: int = 5, interval_ms: int = 100, num_levels: int = 20, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
     """Generate small test order book data for specified duration"""
     print(f"🚀 Generating {duration_minutes} minute(s) of test order book data...")
     print(f"   Interval: {interval_ms}ms")
@@ -96,51 +36,40 @@ def generate_small_test_data(duration_minutes: int = 5, interval_ms: int = 100)
     print(f"   Total snapshots: {num_snapshots:,}")
     print(f"   Estimated file size: ~{num_snapshots * 0.5 / 1000:.1f} KB")
     
-    generator = OrderBookGenerator()
-    snapshots = []
+    generator = OrderBookGenerator(seed=seed)
+    book = allocate_order_book(num_snapshots, num_levels)
     
     start_time = int(time.time() * 1000)
+    book['timestamps'][:] = start_time + np.arange(num_snapshots, dtype=np.int64) * interval_ms
     
-    for i in range(num_snapshots):
-        timestamp = start_time + (i * interval_ms)
-        snapshot = generator.generate_snapshot(timestamp)
-        snapshots.append(snapshot)
-        
-        if i % 100 == 0:
-            progress = (i / num_snapshots) * 100
-            print(f"   Progress: {progress:.1f}% ({i:,}/{num_snapshots:,})")
+    generator.fill_book(book)
     
     print("✅ Data generation complete!")
-    return snapshots
+    return book
 
-def save_small_test_data(snapshots: List[Dict], filename: str = "logs/small_test_orderbook_data.json"):
-    """Save generated data to JSON file"""
+def save_small_test_data(book: Dict[str, np.ndarray], filename: str = "logs/small_test_orderbook_data.json", fmt: str = 'json', pretty: bool = False):
+    """Save generated data as JSON, compressed NPZ arrays or Parquet"""
     print(f"💾 Saving data to {filename}...")
+    num_snapshots = len(book['timestamps'])
     
     metadata = {
         'generated_at': datetime.now().isoformat(),
-        'duration_minutes': len(snapshots) * 100 / (1000 * 60),
+        'duration_minutes': num_snapshots * 100 / (1000 * 60),
         'interval_ms': 100,
-        'num_snapshots': len(snapshots),
+        'num_snapshots': num_snapshots,
         'timeframe_coverage': {
-            '100ms': len(snapshots),
-            '500ms': len(snapshots) // 5,
-            '1sec': len(snapshots) // 10,
-            '1min': len(snapshots) // 600,
-            '5min': len(snapshots) // 3000
+            '100ms': num_snapshots,
+            '500ms': num_snapshots // 5,
+            '1sec': num_snapshots // 10,
+            '1min': num_snapshots // 600,
+            '5min': num_snapshots // 3000
         }
     }
     
-    output_data = {
-        'metadata': metadata,
-        'snapshots': snapshots
-    }
+    save_order_book(book, metadata, filename, fmt, pretty)
     
-    with open(filename, 'w') as f:
-        json.dump(output_data, f, indent=2)
-    
-    print(f"✅ Saved {len(snapshots):,} snapshots to {filename}")
-    print(f"   File size: ~{len(json.dumps(output_data)) / 1024:.1f} KB")
+    print(f"✅ Saved {num_snapshots:,} snapshots to {filename}")
+    print(f"   File size: ~{os.path.getsize(filename) / 1024:.1f} KB")
     
     print("\n📊 Timeframe Coverage:")
     for tf, count in metadata['timeframe_coverage'].items():
@@ -148,22 +77,39 @@ def save_small_test_data(snapshots: List[Dict], filename: str = "logs/small_test
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Generate synthetic BTC order book snapshots.")
+    parser.add_argument(
+        "--format", choices=OUTPUT_FORMATS, default="json",
+        help="Output format (default: json)."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None,
+        help="Random seed for reproducible output (default: random)."
+    )
+    parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent JSON output for human reading (larger and slower to write)."
+    )
+    args = parser.parse_args()
+    if args.format == 'parquet' and pa is None:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
+    
     print("🎯 Small Order Book Test Data Generator")
     print("=" * 50)
     
     # Generate 5 minutes of data at 100ms intervals
-    snapshots = generate_small_test_data(duration_minutes=5, interval_ms=100)
+    book = generate_small_test_data(duration_minutes=5, interval_ms=100, seed=args.seed)
     
     # Save to file
-    save_small_test_data(snapshots)
+    save_small_test_data(book, f"logs/small_test_orderbook_data.{args.format}", args.format, args.pretty)
     
     print("\n🚀 Ready for Fast Fractal Zoom Testing!")
     print("   This smaller dataset will load quickly and allow immediate testing.")
     print("   Use --test-mode to load this data and test fractal zoom coordination.")
     
-    if snapshots:
+    if len(book['timestamps']):
         print(f"\n📋 Sample Data Preview:")
-        sample = snapshots[0]
+        sample = next(iter_snapshots(book))
         print(f"   Symbol: {sample['symbol']}")
         print(f"   Mid Price: ${sample['mid_price']:,.2f}")
         print(f"   Spread: ${sample['spread']:.2f}")
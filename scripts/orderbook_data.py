@@ -0,0 +1,129 @@
+"""
+Order book storage and output shared by the order book test data generators.
+
+A book is a dict of preallocated NumPy arrays (struct-of-arrays): timestamps
+and mid prices per snapshot, plus (num_snapshots, num_levels) price and size
+arrays per side. The generators fill it via OrderBookGenerator and write it out
+with save_order_book as streamed JSON, compressed NPZ or Parquet.
+"""
+
+import json
+from itertools import islice
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+from orderbook_kernels import fill_levels, simulate_mid_prices
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet output is optional
+    pa = None
+
+OUTPUT_FORMATS = ('json', 'npz', 'parquet')
+
+class OrderBookGenerator:
+    def __init__(self, base_price: float = 108000.0, base_spread: float = 0.01, seed: Optional[int] = None):
+        self.base_price = base_price
+        self.base_spread = base_spread
+        self.seed = seed if seed is not None else int(np.random.default_rng().integers(2**31))
+
+    def fill_book(self, book: Dict[str, np.ndarray]):
+        """Generate every snapshot in place into the preallocated book arrays"""
+        rng = np.random.default_rng(self.seed)
+
+        # One vectorized draw for the whole price walk instead of two gauss() calls per tick
+        price_noise = rng.standard_normal((len(book['mid_prices']), 2))
+        simulate_mid_prices(price_noise, self.base_price, book['mid_prices'])
+
+        fill_levels(
+            book['mid_prices'],
+            book['bid_prices'], book['bid_sizes'],
+            book['ask_prices'], book['ask_sizes'],
+            self.base_spread, rng
+        )
+
+def allocate_order_book(num_snapshots: int, num_levels: int) -> Dict[str, np.ndarray]:
+    """Preallocate struct-of-arrays storage for num_snapshots order book snapshots"""
+    return {
+        'timestamps': np.empty(num_snapshots, dtype=np.int64),
+        'mid_prices': np.empty(num_snapshots, dtype=np.float64),
+        'bid_prices': np.empty((num_snapshots, num_levels), dtype=np.float64),
+        'bid_sizes': np.empty((num_snapshots, num_levels), dtype=np.float64),
+        'ask_prices': np.empty((num_snapshots, num_levels), dtype=np.float64),
+        'ask_sizes': np.empty((num_snapshots, num_levels), dtype=np.float64),
+    }
+
+def iter_snapshots(book: Dict[str, np.ndarray], symbol: str = 'BTC-USD') -> Iterator[Dict]:
+    """Lazily materialize JSON-friendly snapshot dicts from the book arrays"""
+    for i in range(len(book['timestamps'])):
+        bid_prices = book['bid_prices'][i].tolist()
+        ask_prices = book['ask_prices'][i].tolist()
+        yield {
+            'timestamp': int(book['timestamps'][i]),
+            'symbol': symbol,
+            'bids': [{'price': p, 'size': s} for p, s in zip(bid_prices, book['bid_sizes'][i].tolist())],
+            'asks': [{'price': p, 'size': s} for p, s in zip(ask_prices, book['ask_sizes'][i].tolist())],
+            'mid_price': float(book['mid_prices'][i]),
+            'spread': ask_prices[0] - bid_prices[0] if bid_prices and ask_prices else 0.0
+        }
+
+def write_json(book: Dict[str, np.ndarray], metadata: Dict, filename: str, pretty: bool = False):
+    """Stream snapshots to a JSON file one at a time instead of building one big dict"""
+    # Compact by default; indentation roughly doubles the file size and only helps humans
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else None
+        dumps = lambda obj: orjson.dumps(obj, option=option)
+    elif pretty:
+        dumps = lambda obj: json.dumps(obj, indent=2).encode()
+    else:
+        dumps = lambda obj: json.dumps(obj, separators=(',', ':')).encode()
+    newline, colon = (b'\n', b': ') if pretty else (b'', b':')
+
+    num_snapshots = len(book['timestamps'])
+    snapshots = iter_snapshots(book)
+    separator = b''
+
+    # Report progress every 5% of the snapshots rather than checking per snapshot
+    step = max(1, num_snapshots // 20)
+
+    with open(filename, 'wb') as f:
+        f.write(b'{' + newline + b'"metadata"' + colon + dumps(metadata) + b',' + newline + b'"snapshots"' + colon + b'[' + newline)
+        for start in range(0, num_snapshots, step):
+            print(f"   Progress: {start / num_snapshots * 100:.1f}% ({start:,}/{num_snapshots:,})")
+            for snapshot in islice(snapshots, step):
+                f.write(separator + dumps(snapshot))
+                separator = b',' + newline
+        f.write(newline + b']' + newline + b'}\n')
+
+def write_parquet(book: Dict[str, np.ndarray], metadata: Dict, filename: str):
+    """Write the book arrays as a Parquet table with one row per snapshot"""
+    if pa is None:
+        raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)")
+
+    num_levels = book['bid_prices'].shape[1]
+    columns = {'timestamp': book['timestamps'], 'mid_price': book['mid_prices']}
+    for key in ('bid_prices', 'bid_sizes', 'ask_prices', 'ask_sizes'):
+        columns[key] = pa.FixedSizeListArray.from_arrays(pa.array(book[key].ravel()), num_levels)
+
+    table = pa.table(columns).replace_schema_metadata({'metadata': json.dumps(metadata)})
+    pq.write_table(table, filename)
+
+def save_order_book(book: Dict[str, np.ndarray], metadata: Dict, filename: str, fmt: str = 'json', pretty: bool = False):
+    """Round the book to output precision and write it as JSON, compressed NPZ arrays or Parquet"""
+    # Prices are only meaningful to the cent; round once here rather than per level
+    for key, decimals in (('bid_prices', 2), ('ask_prices', 2), ('bid_sizes', 6), ('ask_sizes', 6)):
+        np.round(book[key], decimals, out=book[key])
+
+    if fmt == 'npz':
+        np.savez_compressed(filename, metadata=np.array([json.dumps(metadata)]), **book)
+    elif fmt == 'parquet':
+        write_parquet(book, metadata, filename)
+    else:
+        write_json(book, metadata, filename, pretty)
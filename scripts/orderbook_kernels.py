@@ -0,0 +1,60 @@
+"""
+Kernels shared by the order book test data generators.
+
+The mid price walk has a step-to-step dependency (decaying trend momentum and
+range clamping), so it runs as a single Numba-compiled loop, either ahead of
+time via build_aot.py or JIT-compiled on first use. Everything else is
+independent per snapshot and is generated for all snapshots at once as
+(num_snapshots, num_levels) NumPy array operations. When Numba isn't
+installed the price walk runs as plain Python, just slower.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Run the kernels uncompiled when numba isn't installed
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+def mid_price_walk(price_noise, base_price, mid_prices):
+    """Run the mid price random walk into mid_prices
+
+    price_noise is a precomputed (num_snapshots, 2) batch of standard normals
+    driving the trend and random components of each step.
+    """
+    price = base_price
+    trend = 0.0
+    for n in range(mid_prices.shape[0]):
+        # Random walk with decaying momentum, kept in a reasonable range
+        trend = trend * 0.99 + price_noise[n, 0] * 0.0001
+        price *= 1.0 + trend + price_noise[n, 1] * 0.0001
+        price = max(100000.0, min(120000.0, price))
+        mid_prices[n] = price
+
+# Prefer the ahead-of-time compiled kernel from build_aot.py so short runs skip
+# JIT compilation entirely; otherwise JIT it and cache the machine code on disk
+try:
+    from _ext.orderbook_kernels import simulate_mid_prices
+except ImportError:
+    simulate_mid_prices = njit(cache=True, boundscheck=False)(mid_price_walk)
+
+def fill_levels(mid_prices, bid_prices, bid_sizes, ask_prices, ask_sizes, base_spread, rng):
+    """Generate every bid/ask level for every snapshot in one broadcast sweep"""
+    num_levels = bid_prices.shape[1]
+    i = np.arange(num_levels)
+
+    # Bids sit below mid and asks above, so offsets growing with depth
+    # already yield best-first order (bids descending, asks ascending)
+    offsets = base_spread * (1 + i * 0.1)
+    np.multiply(mid_prices[:, None], 1 - offsets, out=bid_prices)
+    np.multiply(mid_prices[:, None], 1 + offsets, out=ask_prices)
+
+    # Volume decreases with depth, with noise and occasional large orders
+    base_volume = 10.0 / (1 + i * 0.2)
+    for sizes in (bid_sizes, ask_sizes):
+        np.multiply(base_volume, rng.uniform(0.5, 2.0, sizes.shape), out=sizes)
+        large = rng.random(sizes.shape) < 0.05
+        sizes[large] *= rng.uniform(5, 20, large.sum())
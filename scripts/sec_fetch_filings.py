@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sec.sec_api import SECDataFetcher
+from sec_json import dumps
 
 async def main():
     if len(sys.argv) < 2:
@@ -20,7 +21,7 @@ async def main():
     try:
         fetcher = SECDataFetcher()
         filings = await fetcher.get_filings_by_form(ticker, form_type)
-        print("FILINGS_DATA:" + json.dumps(filings))
+        print("FILINGS_DATA:" + dumps(filings))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
         sys.exit(1)
@@ -8,6 +8,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sec.sec_api import SECDataFetcher
+from sec_json import dumps
 
 async def main():
     if len(sys.argv) < 2:
@@ -19,7 +20,7 @@ async def main():
     try:
         fetcher = SECDataFetcher()
         transactions = await fetcher.fetch_insider_filings(ticker)
-        print("TRANSACTIONS_DATA:" + json.dumps(transactions))
+        print("TRANSACTIONS_DATA:" + dumps(transactions))
     except Exception as e:
         print(json.dumps({"error": str(e)}))
         sys.exit(1)
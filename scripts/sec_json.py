@@ -0,0 +1,13 @@
+"""JSON serialization shared by the SEC fetch scripts and the SEC worker"""
+import json
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when orjson isn't installed
+    orjson = None
+
+def dumps(obj) -> str:
+    """Serialize obj to a JSON string, stringifying types like Decimal"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return json.dumps(obj, default=str)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Long-running SEC worker serving NDJSON requests over stdin/stdout
+
+Keeps one event loop and one SECDataFetcher alive so repeated requests skip
+interpreter startup, imports and HTTP session setup.
+
+Request:  {"id": 1, "op": "filings", "ticker": "AAPL", "form_type": "10-K"}
+Response: {"id": 1, "op": "filings", "data": [...]}  or  {"id": 1, "op": "filings", "error": "..."}
+Ops: filings, transactions, financials. Emits {"event": "ready"} once started.
+"""
+import sys
+import json
+import asyncio
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sec.sec_api import SECDataFetcher
+from sec_json import dumps
+
+def write_message(message: dict):
+    """Write one response line and flush so the client sees it immediately"""
+    sys.stdout.write(dumps(message) + "\n")
+    sys.stdout.flush()
+
+async def handle_request(fetcher: SECDataFetcher, request: dict):
+    op = request.get("op")
+    ticker = request.get("ticker")
+    response = {"id": request.get("id"), "op": op}
+
+    try:
+        if not ticker:
+            raise ValueError("Missing ticker argument")
+        if op == "filings":
+            response["data"] = await fetcher.get_filings_by_form(ticker, request.get("form_type") or None)
+        elif op == "transactions":
+            response["data"] = await fetcher.fetch_insider_filings(ticker)
+        elif op == "financials":
+            response["data"] = await fetcher.get_financial_summary(ticker)
+        else:
+            raise ValueError(f"Unknown op: {op}")
+    except Exception as e:
+        response["error"] = str(e)
+
+    write_message(response)
+
+async def main():
+    fetcher = SECDataFetcher()
+    loop = asyncio.get_running_loop()
+    pending = set()
+
+    write_message({"event": "ready"})
+    try:
+        while True:
+            # Blocking readline in a thread keeps this portable to Windows pipes
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            line = line.strip()
+            if not line:
+                continue
+
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                write_message({"id": None, "error": f"Invalid request: {e}"})
+                continue
+
+            # Handle requests concurrently; responses are matched up by id
+            task = asyncio.create_task(handle_request(fetcher, request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        # stdin closed: finish in-flight requests, then exit
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        await fetcher.close()
+
+if __name__ == "__main__":
+    asyncio.run(main())
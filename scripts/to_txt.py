@@ -1,8 +1,46 @@
 import os
 import argparse
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
-def convert_directory_to_txt(directory, output_file, include_md=False, include_mdc=False):
+# Buffer the output file in 1 MiB chunks
+COPY_CHUNK_SIZE = 1 << 20
+
+# File reads are I/O-bound and release the GIL, so read with a thread pool
+READ_WORKERS = 16
+
+# Sidecar written next to the output: {path: [mtime_ns, size, offset, length]}
+MANIFEST_SUFFIX = ".manifest.json"
+
+def read_source_file(file_path):
+    # Returns (content, error) so failures can be reported in walk order
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read(), None
+    except Exception as e:
+        return None, e
+
+def file_stamp(file_path):
+    try:
+        st = os.stat(file_path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+def load_manifest(output_file):
+    # Only trust the manifest if it describes the output file that is actually on disk
+    try:
+        with open(output_file + MANIFEST_SUFFIX, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("output_size") != os.path.getsize(output_file):
+            return {}
+        return manifest.get("files", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+def convert_directory_to_txt(directory, output_file, include_md=False, include_mdc=False, incremental=True):
     # Define the file extensions to include
     file_extensions = ('.cpp', '.h', '.hpp', '.CMake', '.qml')
     if include_md:
@@ -10,19 +48,53 @@ def convert_directory_to_txt(directory, output_file, include_md=False, include_m
     if include_mdc:
         file_extensions = file_extensions + ('.mdc', '.MDC')
 
-    with open(output_file, 'w', encoding='utf-8') as txt_file:
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(file_extensions):
-                    file_path = os.path.join(root, file)
-                    txt_file.write(f"File: {file_path}\n")
-                    txt_file.write("-" * 80 + "\n")
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            txt_file.write(f.read())
-                    except Exception as e:
-                        txt_file.write(f"[Error reading file: {e}]\n")
-                    txt_file.write("\n" + "=" * 80 + "\n\n")
+    file_paths = [
+        os.path.join(root, file)
+        for root, _, files in os.walk(directory)
+        for file in files
+        if file.endswith(file_extensions)
+    ]
+
+    # Files whose (mtime, size) match the previous run are copied from the old output
+    previous = load_manifest(output_file) if incremental else {}
+    stamps = {file_path: file_stamp(file_path) for file_path in file_paths}
+    reused = {
+        file_path for file_path in file_paths
+        if stamps[file_path] is not None and previous.get(file_path, [])[:2] == stamps[file_path]
+    }
+    changed = [file_path for file_path in file_paths if file_path not in reused]
+
+    # Build the new output next to the old one, since unchanged blocks are read from it
+    entries = {}
+    tmp_file = output_file + ".tmp"
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor, \
+            open(tmp_file, 'wb', buffering=COPY_CHUNK_SIZE) as txt_file, \
+            (open(output_file, 'rb') if reused else nullcontext()) as old_file:
+        # Read changed files concurrently, but write sequentially in walk order so the output is deterministic
+        results = executor.map(read_source_file, changed)
+        for file_path in file_paths:
+            offset = txt_file.tell()
+            if file_path in reused:
+                _, _, old_offset, length = previous[file_path]
+                old_file.seek(old_offset)
+                txt_file.write(old_file.read(length))
+            else:
+                content, error = next(results)
+                if error is None:
+                    body = content
+                else:
+                    body = f"[Error reading file: {error}]\n"
+                block = (f"File: {file_path}\n" + "-" * 80 + "\n" + body + "\n" + "=" * 80 + "\n\n").encode('utf-8')
+                txt_file.write(block)
+                length = len(block)
+                # Don't cache failed reads; retry them on the next run
+                if error is not None or stamps[file_path] is None:
+                    continue
+            entries[file_path] = stamps[file_path] + [offset, length]
+
+    os.replace(tmp_file, output_file)
+    with open(output_file + MANIFEST_SUFFIX, 'w', encoding='utf-8') as f:
+        json.dump({"output_size": os.path.getsize(output_file), "files": entries}, f)
 
 def main():
     parser = argparse.ArgumentParser(
@@ -46,7 +118,11 @@ def main():
         help="Include MDC files (.mdc, .MDC) in the output."
     )
     parser.add_argument(
-        "-v", "--version", action="version", version="to_txt.py 1.1"
+        "--full", action="store_true",
+        help="Ignore the manifest from the previous run and re-read every file."
+    )
+    parser.add_argument(
+        "-v", "--version", action="version", version="to_txt.py 1.2"
     )
 
     args = parser.parse_args()
@@ -59,7 +135,8 @@ def main():
         args.directory,
         args.output_file,
         include_md=args.include_md,
-        include_mdc=args.include_mdc
+        include_mdc=args.include_mdc,
+        incremental=not args.full
     )
 
 if __name__ == "__main__":
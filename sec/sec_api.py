@@ -4,6 +4,7 @@ import logging
 import xml.etree.ElementTree as ET
 import asyncio
 import re
+import time
 
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Union, Tuple, Any, Callable, Awaitable
@@ -42,6 +43,10 @@ class SECDataFetcher:
         "DEF 14A": "Definitive proxy statement",
     }
 
+    # Seconds a get_filings_by_form result is reused from memory before the
+    # disk cache / SEC API is consulted again. Only pays off in long-lived processes.
+    FILINGS_MEMO_TTL = 300
+
     # Constants moved to specific processors:
     # - TRANSACTION_CODE_MAP, ACQUISITION_CODES, DISPOSITION_CODES -> Form4Processor
     # - KEY_FINANCIAL_SUMMARY_METRICS -> FinancialDataProcessor
@@ -71,6 +76,8 @@ class SECDataFetcher:
         self.financial_processor = FinancialDataProcessor(
             fetch_facts_func=self.get_company_facts # Pass the method directly
         )
+        # In-memory filings cache: (ticker, form_type, days_back) -> (monotonic time, filings)
+        self._filings_memo: Dict[Tuple[str, str, int], Tuple[float, List[Dict]]] = {}
 
 
     # === CORE ORCHESTRATION METHODS ===
@@ -205,13 +212,20 @@ class SECDataFetcher:
         """ Fetches a list of filings of a specific form type within a given timeframe."""
         ticker = ticker.upper()
         logging.debug(f"Getting {form_type} filings for {ticker} (days back: {days_back}, cache: {use_cache})")
+        memo_key = (ticker, form_type, days_back)
         if use_cache:
+            memo = self._filings_memo.get(memo_key)
+            if memo and time.monotonic() - memo[0] < self.FILINGS_MEMO_TTL:
+                logging.debug(f"Returning {len(memo[1])} {form_type} filings for {ticker} from memory.")
+                return [dict(f) for f in memo[1]]
+
             cache_data = await self.cache_manager.load_data(ticker, 'forms', form_type=form_type)
             if cache_data:
                 cutoff_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
                 if isinstance(cache_data, list):
                     filtered_cache = [f for f in cache_data if f.get('filing_date', '') >= cutoff_date]
                     logging.debug(f"Found {len(filtered_cache)} fresh {form_type} filings in cache for {ticker}.")
+                    self._remember_filings(memo_key, filtered_cache)
                     return filtered_cache
                 else:
                     logging.warning(f"Expected list from filings cache for {ticker} {form_type}, got {type(cache_data)}. Ignoring cache.")
@@ -276,11 +290,21 @@ class SECDataFetcher:
             logging.info(f"Extracted {len(filings)} {form_type} filings for {ticker} within {days_back} days.")
             if filings:
                  await self.cache_manager.save_data(ticker, 'forms', filings, form_type=form_type)
+            self._remember_filings(memo_key, filings)
             return filings
         except Exception as e:
              logging.error(f"Error processing filings for {ticker}: {e}", exc_info=True)
              return []
 
+    def _remember_filings(self, memo_key: Tuple[str, str, int], filings: List[Dict]):
+        """Memoize a filings result, dropping expired entries so the memo doesn't grow without bound."""
+        now = time.monotonic()
+        expired = [key for key, (stored_at, _) in self._filings_memo.items() if now - stored_at >= self.FILINGS_MEMO_TTL]
+        for key in expired:
+            del self._filings_memo[key]
+        # Filing dicts are flat, so copying each one keeps callers from mutating the memo (and vice versa)
+        self._filings_memo[memo_key] = (now, [dict(f) for f in filings])
+
     # === CONVENIENCE FILING WRAPPERS ===
     async def fetch_insider_filings(self, ticker: str, days_back: int = 90, use_cache: bool = True) -> List[Dict]:
         """Convenience method to fetch Form 4 (insider trading) filings."""